@@ -21,11 +21,9 @@ logger = logging.getLogger(__name__)
 def _encode_image(image_path: str) -> str | None:
 	"""Encode image to base64 string."""
 	try:
-		path = Path(image_path)
-		if not path.exists():
-			return None
-		with open(path, 'rb') as f:
-			return base64.b64encode(f.read()).decode('utf-8')
+		return base64.b64encode(Path(image_path).read_bytes()).decode('utf-8')
+	except FileNotFoundError:
+		return None
 	except Exception as e:
 		logger.warning(f'Failed to encode image {image_path}: {e}')
 		return None
@@ -41,6 +39,17 @@ def _truncate_text(text: str, max_length: int, from_beginning: bool = False) ->
 		return text[: max_length - 23] + '...[text truncated]...'
 
 
+_GROUND_TRUTH_SECTION = """
+**GROUND TRUTH VALIDATION (HIGHEST PRIORITY):**
+The <ground_truth> section contains verified correct information for this task. This can be:
+- **Evaluation criteria**: Specific conditions that must be met (e.g., "The success popup should show up", "Must extract exactly 5 items")
+- **Factual answers**: The correct answer to a question or information retrieval task (e.g. "10/11/24", "Paris")
+- **Expected outcomes**: What should happen after task completion (e.g., "Google Doc must be created", "File should be downloaded")
+
+The ground truth takes ABSOLUTE precedence over all other evaluation criteria. If the ground truth is not satisfied by the agent's execution and final response, the verdict MUST be false.
+"""
+
+
 def construct_judge_messages(
 	task: str,
 	final_result: str,
@@ -91,17 +100,7 @@ def construct_judge_messages(
 	current_date = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
 
 	# System prompt for judge - conditionally add ground truth section
-	ground_truth_section = ''
-	if ground_truth:
-		ground_truth_section = """
-**GROUND TRUTH VALIDATION (HIGHEST PRIORITY):**
-The <ground_truth> section contains verified correct information for this task. This can be:
-- **Evaluation criteria**: Specific conditions that must be met (e.g., "The success popup should show up", "Must extract exactly 5 items")
-- **Factual answers**: The correct answer to a question or information retrieval task (e.g. "10/11/24", "Paris")
-- **Expected outcomes**: What should happen after task completion (e.g., "Google Doc must be created", "File should be downloaded")
-
-The ground truth takes ABSOLUTE precedence over all other evaluation criteria. If the ground truth is not satisfied by the agent's execution and final response, the verdict MUST be false.
-"""
+	ground_truth_section = _GROUND_TRUTH_SECTION if ground_truth else ''
 
 	system_prompt = f"""You are an expert judge evaluating browser automation agent performance.
 
@@ -452,6 +452,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._set_screenshot_service()
 
 		# Action setup
+		self._agent_output_types: dict[tuple[type[ActionModel], bool, bool], type[AgentOutput]] = {}
 		self._setup_action_models()
 		self._set_browser_use_version_and_source(source)
 
@@ -776,21 +777,25 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initially only include actions with no filters
 		self.ActionModel = self.tools.registry.create_action_model()
 		# Create output model with the dynamic actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_type(self.ActionModel)
 
 		# used to force the done action when max_steps is reached
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'])
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_type(self.DoneActionModel)
+
+	def _get_agent_output_type(self, action_model: type[ActionModel]) -> type[AgentOutput]:
+		"""Get the AgentOutput type for an action model in the current output mode, reusing previously built types"""
+		key = (action_model, self.settings.flash_mode, self.settings.use_thinking)
+		agent_output = self._agent_output_types.get(key)
+		if agent_output is None:
+			if self.settings.flash_mode:
+				agent_output = AgentOutput.type_with_custom_actions_flash_mode(action_model)
+			elif self.settings.use_thinking:
+				agent_output = AgentOutput.type_with_custom_actions(action_model)
+			else:
+				agent_output = AgentOutput.type_with_custom_actions_no_thinking(action_model)
+			self._agent_output_types[key] = agent_output
+		return agent_output
 
 	def _get_skill_slug(self, skill: 'Skill', all_skills: list['Skill']) -> str:
 		"""Generate a clean slug from skill title for action names
@@ -2913,6 +2918,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""Generate AI summary of rerun completion using screenshot and last step info"""
 		from browser_use.agent.views import RerunSummaryAction
 
+		# Nothing was replayed, so there is nothing for the LLM to summarize
+		if not results:
+			return ActionResult(
+				is_done=True,
+				success=True,
+				extracted_content='Rerun completed: no steps to replay',
+				long_term_memory='Rerun completed: 0 steps succeeded, 0 errors',
+			)
+
 		# Get current screenshot
 		screenshot_b64 = None
 		try:
@@ -3979,14 +3993,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		return self._message_manager
 
 	async def close(self):
-		"""Close all resources"""
+		"""Close all resources. Safe to call repeatedly; browser teardown is skipped once the session is already down."""
 		try:
 			# Only close browser if keep_alive is False (or not set)
 			if self.browser_session is not None:
 				if not self.browser_session.browser_profile.keep_alive:
-					# Kill the browser session - this dispatches BrowserStopEvent,
-					# stops the EventBus with clear=True, and recreates a fresh EventBus
-					await self.browser_session.kill()
+					# Skip if already killed (e.g. by rerun_history's finally): kill() resets both of these.
+					# Checking the live session instead of a flag means a restarted session is still killed.
+					if self.browser_session._cdp_client_root is not None or self.browser_session.session_manager is not None:
+						# Kill the browser session - this dispatches BrowserStopEvent,
+						# stops the EventBus with clear=True, and recreates a fresh EventBus
+						await self.browser_session.kill()
 				else:
 					# keep_alive=True sessions shouldn't keep the event loop alive after agent.run()
 					await self.browser_session.event_bus.stop(
@@ -4029,21 +4046,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Create new action model with current page's filtered actions
 		self.ActionModel = self.tools.registry.create_action_model(page_url=page_url)
 		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._get_agent_output_type(self.ActionModel)
 
 		# Update done action model too
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		self.DoneAgentOutput = self._get_agent_output_type(self.DoneActionModel)
 
 	async def authenticate_cloud_sync(self, show_instructions: bool = True) -> bool:
 		"""
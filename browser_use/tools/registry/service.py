@@ -38,6 +38,9 @@ class Registry(Generic[Context]):
 		self.telemetry = ProductTelemetry()
 		# Create a new list to avoid mutable default argument issues
 		self.exclude_actions = list(exclude_actions) if exclude_actions is not None else []
+		# create_action_model() results keyed by the (name, id(action)) pairs they were built from;
+		# the registered actions are kept alongside the model so their ids can't be reused while cached
+		self._action_model_cache: dict[tuple[tuple[str, int], ...], tuple[tuple[RegisteredAction, ...], type[ActionModel]]] = {}
 
 	def exclude_action(self, action_name: str) -> None:
 		"""Exclude an action from the registry after initialization.
@@ -521,8 +524,6 @@ class Registry(Generic[Context]):
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
 		"""
-		from typing import Union
-
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
 		#   if page_url is provided, only include actions that match the URL
@@ -545,6 +546,20 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		# Reuse the model built for the exact same set of registered actions
+		cache_key = tuple((name, id(action)) for name, action in available_actions.items())
+		cached = self._action_model_cache.get(cache_key)
+		if cached is not None:
+			return cached[1]
+
+		result_model = self._build_action_model(available_actions)
+		self._action_model_cache[cache_key] = (tuple(available_actions.values()), result_model)
+		return result_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Build the ActionModel union for the given actions (see create_action_model)"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
@@ -7,8 +7,6 @@ authentication headers, these headers need to be included in the WebSocket hands
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from browser_use.browser.profile import BrowserProfile
 from browser_use.browser.session import BrowserSession
 
@@ -36,7 +34,6 @@ def test_browser_profile_headers_inherited():
 	assert session.browser_profile.headers == test_headers
 
 
-@pytest.mark.asyncio
 async def test_cdp_client_headers_passed_on_connect():
 	"""Test that headers from BrowserProfile are passed to CDPClient on connect()."""
 	test_headers = {
@@ -91,7 +88,6 @@ async def test_cdp_client_headers_passed_on_connect():
 			assert call_kwargs[1].get('max_ws_frame_size') == 200 * 1024 * 1024, 'max_ws_frame_size should be set'
 
 
-@pytest.mark.asyncio
 async def test_cdp_client_no_headers_when_none():
 	"""Test that CDPClient is created with None headers when profile has no headers."""
 	session = BrowserSession(cdp_url='wss://example.com/cdp')
@@ -127,7 +123,6 @@ async def test_cdp_client_no_headers_when_none():
 			assert actual_headers['User-Agent'].startswith('browser-use/'), 'User-Agent should be injected for remote connections'
 
 
-@pytest.mark.asyncio
 async def test_headers_used_for_json_version_endpoint():
 	"""Test that headers are also used when fetching WebSocket URL from /json/version."""
 	test_headers = {'Authorization': 'Bearer test-token'}
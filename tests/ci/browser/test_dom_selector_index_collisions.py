@@ -3,8 +3,6 @@
 from types import SimpleNamespace
 from typing import Any, cast
 
-import pytest
-
 from browser_use.actor.page import Page
 from browser_use.agent.service import Agent
 from browser_use.browser import python_highlights
@@ -100,7 +98,6 @@ def test_session_lookup_keeps_selector_and_backend_identity_separate():
 	assert session._get_cached_node_by_backend_id(5, 'iframe') is iframe_input
 
 
-@pytest.mark.asyncio
 async def test_history_remapping_prefers_the_original_frame():
 	"""History replay must not choose an identical element from a different frame."""
 	main_input = _node(
@@ -176,7 +173,6 @@ def test_screenshot_overlay_uses_selector_index(monkeypatch):
 	assert captured_text == ['101']
 
 
-@pytest.mark.asyncio
 async def test_interaction_highlight_uses_the_nodes_cdp_session(monkeypatch):
 	"""The transient action highlight must resolve coordinates in the node's OOPIF session."""
 	iframe_input = _node('input', node_id=2, backend_node_id=5, session_id='iframe')
@@ -201,7 +197,6 @@ async def test_interaction_highlight_uses_the_nodes_cdp_session(monkeypatch):
 	assert resolved_nodes == [iframe_input]
 
 
-@pytest.mark.asyncio
 async def test_actor_prompt_element_uses_the_selected_nodes_session(monkeypatch):
 	"""Actor prompt lookup must return an Element bound to the selected OOPIF session."""
 	main_input = _node('input', node_id=1, backend_node_id=5, session_id='main')
@@ -1,8 +1,6 @@
 import asyncio
 from typing import Any
 
-import pytest
-
 from browser_use.browser import BrowserProfile, BrowserSession
 from browser_use.browser.profile import ProxySettings
 from browser_use.config import CONFIG
@@ -22,7 +20,6 @@ def test_chromium_args_include_proxy_flags():
 	assert any(a == '--proxy-bypass-list=localhost,127.0.0.1' for a in args), args
 
 
-@pytest.mark.asyncio
 async def test_cdp_proxy_auth_handler_registers_and_responds():
 	# Create profile with proxy auth credentials
 	profile = BrowserProfile(
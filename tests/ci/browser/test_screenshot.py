@@ -57,7 +57,6 @@ async def browser_session():
 	await session.kill()
 
 
-@pytest.mark.asyncio
 async def test_basic_screenshots(browser_session: BrowserSession, httpserver):
 	"""Navigate to a local page and ensure screenshot helpers return bytes."""
 
@@ -7,10 +7,12 @@ Sets up environment variables to ensure tests never connect to production servic
 import os
 import socketserver
 import tempfile
+from typing import Any, TypeVar, overload
 from unittest.mock import AsyncMock
 
 import pytest
 from dotenv import load_dotenv
+from pydantic import BaseModel
 from pytest_httpserver import HTTPServer
 
 # Fix for httpserver hanging on shutdown - prevent blocking on socket close
@@ -19,8 +21,9 @@ socketserver.ThreadingMixIn.block_on_close = False
 # Also set daemon threads to prevent hanging
 socketserver.ThreadingMixIn.daemon_threads = True
 
-from browser_use.agent.views import AgentOutput
+from browser_use.agent.views import AgentOutput, RerunSummaryAction
 from browser_use.llm import BaseChatModel
+from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.tools.service import Tools
 
@@ -72,6 +75,28 @@ def setup_test_environment():
 			os.environ[key] = value
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+	"""Pin tests that share class-, module- or package-scoped fixtures to one xdist worker per module.
+
+	With ``--dist=loadgroup`` ungrouped tests are spread one by one, so any test whose fixture closure holds such a
+	fixture (``browser_session``, per-module agents that start their own Chromium, ...) is grouped by module.
+	Session-scoped fixtures (``tmp_path_factory``, ``make_httpserver``, ...) don't count: every worker builds its
+	own copy anyway, so tests that only need those stay ungrouped and spread freely.
+	Only affects local ``pytest -n`` runs; CI runs each file in its own job without xdist.
+	"""
+	if not config.pluginmanager.hasplugin('xdist'):
+		return
+
+	shared_scopes = ('class', 'module', 'package')
+	for item in items:
+		fixtureinfo = getattr(item, '_fixtureinfo', None)
+		if fixtureinfo is None:
+			continue
+		if any(defs and defs[-1].scope in shared_scopes for defs in fixtureinfo.name2fixturedefs.values()):
+			module_path = item.nodeid.split('::', 1)[0]
+			item.add_marker(pytest.mark.xdist_group(name=module_path))
+
+
 # not a fixture, mock_llm() provides this in a fixture below, this is a helper so that it can accept args
 def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	"""Create a mock LLM that returns specified actions or a default done action.
@@ -154,6 +179,46 @@ def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	return llm
 
 
+T = TypeVar('T', bound=BaseModel)
+
+
+class FakeSummaryLLM(BaseChatModel):
+	"""Minimal async LLM stub that answers rerun summary requests with the given RerunSummaryAction.
+
+	Avoids AsyncMock's per-call bookkeeping; raises ValueError for any output_format other than RerunSummaryAction.
+	"""
+
+	model = 'mock-summary-llm'
+
+	@property
+	def provider(self) -> str:
+		return 'mock'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	def __init__(self, summary_action: RerunSummaryAction):
+		self._summary_action = summary_action
+		self.calls = 0
+
+	@overload
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T], **kwargs: Any) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None, **kwargs: Any
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		self.calls += 1
+		if output_format is not RerunSummaryAction:
+			raise ValueError('Unexpected output_format')
+		return ChatInvokeCompletion(completion=self._summary_action, usage=None)  # type: ignore[return-value]
+
+
 @pytest.fixture(scope='module')
 async def browser_session():
 	"""Create a real browser session for testing"""
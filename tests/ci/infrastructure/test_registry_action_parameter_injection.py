@@ -124,7 +124,6 @@ class TestBrowserContext:
 		"""
 		pass  # Method was removed from BrowserSession
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_navigate_and_get_current_page(self, browser_session, base_url):
 		"""Test that navigate method changes the URL and get_current_page returns the proper page."""
@@ -144,7 +143,6 @@ class TestBrowserContext:
 		title = await browser_session.get_current_page_title()
 		assert title == 'Test Home Page'
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_refresh_page(self, browser_session, base_url):
 		"""Test that refresh_page correctly reloads the current page."""
@@ -171,7 +169,6 @@ class TestBrowserContext:
 		# Verify the page title is still correct
 		assert title_after == 'Test Home Page'
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_execute_javascript(self, browser_session, base_url):
 		"""Test that execute_javascript correctly executes JavaScript in the current page."""
@@ -194,7 +191,6 @@ class TestBrowserContext:
 		bg_color = await browser_session.execute_javascript('document.body.style.backgroundColor')
 		assert bg_color == 'red'
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	@pytest.mark.skip(reason='get_scroll_info API changed - depends on page object that no longer exists')
 	async def test_get_scroll_info(self, browser_session, base_url):
@@ -225,7 +221,6 @@ class TestBrowserContext:
 		assert pixels_above_after_scroll >= 400, 'Page should be scrolled down at least 400px'
 		assert pixels_below_after_scroll < pixels_below_initial, 'Less content should be below viewport after scrolling'
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_take_screenshot(self, browser_session, base_url):
 		"""Test that take_screenshot returns a valid base64 encoded image."""
@@ -250,7 +245,6 @@ class TestBrowserContext:
 		except Exception as e:
 			pytest.fail(f'Failed to decode screenshot as base64: {e}')
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_switch_tab_operations(self, browser_session, base_url):
 		"""Test tab creation, switching, and closing operations."""
@@ -333,7 +327,6 @@ class TestBrowserContext:
 	# 	)
 	# 	assert not attribute_exists, 'browser-user-highlight-id attribute should be removed'
 
-	@pytest.mark.asyncio
 	@pytest.mark.skip(reason='TODO: fix')
 	async def test_custom_action_with_no_arguments(self, browser_session, base_url):
 		"""Test that custom actions with no arguments are handled correctly"""
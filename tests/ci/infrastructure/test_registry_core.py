@@ -477,6 +477,27 @@ class TestRegistryEdgeCases:
 		assert result.extracted_content is not None
 		assert 'Should execute: test' in result.extracted_content
 
+	def test_create_action_model_reused_until_actions_change(self, registry):
+		"""create_action_model returns the same model for an unchanged action set and rebuilds when it changes"""
+
+		@registry.action('First action')
+		async def first_action(text: str):
+			return ActionResult(extracted_content=text)
+
+		model = registry.create_action_model()
+		assert registry.create_action_model() is model
+
+		@registry.action('Second action')
+		async def second_action(text: str):
+			return ActionResult(extracted_content=text)
+
+		extended_model = registry.create_action_model()
+		assert extended_model is not model
+		assert registry.create_action_model(include_actions=['first_action']) is model
+
+		registry.exclude_action('second_action')
+		assert registry.create_action_model() is model
+
 
 class TestExistingToolsActions:
 	"""Test that existing tools actions continue to work"""
@@ -1,7 +1,5 @@
 """Test Google model button click."""
 
-import pytest
-
 from browser_use.llm.google.chat import ChatGoogle
 from tests.ci.models.model_test_helper import run_model_button_click_test
 
@@ -73,7 +71,6 @@ def test_x_goog_api_client_header_with_dict_http_options():
 	assert http_opts.get('headers', {}).get('x-goog-api-client', '').startswith('browser-use/')
 
 
-@pytest.mark.asyncio
 async def test_chat_google_temperature_fallback():
 	"""Test that ChatGoogle sets temperature config conditionally based on model."""
 	from unittest.mock import AsyncMock, MagicMock, patch
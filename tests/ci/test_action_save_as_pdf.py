@@ -1,4 +1,5 @@
 import asyncio
+import os
 import tempfile
 
 import anyio
@@ -91,6 +92,15 @@ def _get_attachments(result: ActionResult) -> list[str]:
 	return result.attachments
 
 
+def _assert_valid_pdf(pdf_path: str, min_size: int = 0) -> None:
+	"""Assert the file exists, starts with the %PDF- magic bytes and is larger than min_size."""
+	size = os.stat(pdf_path).st_size
+	with open(pdf_path, 'rb') as f:
+		header = f.read(5)
+	assert header == b'%PDF-', f'File does not start with PDF magic bytes: {header!r}'
+	assert size > min_size, f'PDF seems too small ({size} bytes), may be empty'
+
+
 class TestSaveAsPdf:
 	"""Tests for the save_as_pdf action."""
 
@@ -119,11 +129,7 @@ class TestSaveAsPdf:
 
 			pdf_path = attachments[0]
 			assert pdf_path.endswith('.pdf')
-			assert await anyio.Path(pdf_path).exists()
-
-			# Verify it's actually a PDF (starts with %PDF magic bytes)
-			header = await anyio.Path(pdf_path).read_bytes()
-			assert header[:5] == b'%PDF-', f'File does not start with PDF magic bytes: {header[:5]!r}'
+			_assert_valid_pdf(pdf_path)
 
 	async def test_save_as_pdf_custom_filename(self, tools, browser_session, base_url):
 		"""save_as_pdf with a custom filename uses that name."""
@@ -194,67 +200,33 @@ class TestSaveAsPdf:
 			assert await anyio.Path(attachments2[0]).exists()
 			assert 'duplicate (1).pdf' in attachments2[0]
 
-	async def test_save_as_pdf_landscape(self, tools, browser_session, base_url):
-		"""save_as_pdf with landscape=True produces a valid PDF."""
-		await tools.navigate(url=f'{base_url}/pdf-test', new_tab=False, browser_session=browser_session)
-		await asyncio.sleep(0.5)
-
-		with tempfile.TemporaryDirectory() as temp_dir:
-			file_system = FileSystem(temp_dir)
-			result = await tools.save_as_pdf(
-				file_name='landscape-test',
-				landscape=True,
-				browser_session=browser_session,
-				file_system=file_system,
-			)
-
-			assert isinstance(result, ActionResult)
-			attachments = _get_attachments(result)
-			assert await anyio.Path(attachments[0]).exists()
-
-			header = await anyio.Path(attachments[0]).read_bytes()
-			assert header[:5] == b'%PDF-'
-
-	async def test_save_as_pdf_a4_format(self, tools, browser_session, base_url):
-		"""save_as_pdf with paper_format='A4' produces a valid PDF."""
-		await tools.navigate(url=f'{base_url}/pdf-test', new_tab=False, browser_session=browser_session)
-		await asyncio.sleep(0.5)
-
-		with tempfile.TemporaryDirectory() as temp_dir:
-			file_system = FileSystem(temp_dir)
-			result = await tools.save_as_pdf(
-				file_name='a4-test',
-				paper_format='A4',
-				browser_session=browser_session,
-				file_system=file_system,
-			)
-
-			assert isinstance(result, ActionResult)
-			attachments = _get_attachments(result)
-			assert await anyio.Path(attachments[0]).exists()
-
-	async def test_save_as_pdf_with_background(self, tools, browser_session, base_url):
-		"""save_as_pdf with print_background=True on a styled page produces a valid PDF."""
-		await tools.navigate(url=f'{base_url}/pdf-styled', new_tab=False, browser_session=browser_session)
+	@pytest.mark.parametrize(
+		'path, file_name, pdf_options',
+		[
+			('/pdf-test', 'landscape-test', {'landscape': True}),
+			('/pdf-test', 'a4-test', {'paper_format': 'A4'}),
+			('/pdf-styled', 'styled-with-bg', {'print_background': True}),
+		],
+		ids=['landscape', 'a4_format', 'with_background'],
+	)
+	async def test_save_as_pdf_with_options(self, tools, browser_session, base_url, path, file_name, pdf_options):
+		"""save_as_pdf with extra print options produces a valid, non-empty PDF."""
+		await tools.navigate(url=f'{base_url}{path}', new_tab=False, browser_session=browser_session)
 		await asyncio.sleep(0.5)
 
 		with tempfile.TemporaryDirectory() as temp_dir:
 			file_system = FileSystem(temp_dir)
 			result = await tools.save_as_pdf(
-				file_name='styled-with-bg',
-				print_background=True,
+				file_name=file_name,
+				**pdf_options,
 				browser_session=browser_session,
 				file_system=file_system,
 			)
 
 			assert isinstance(result, ActionResult)
 			attachments = _get_attachments(result)
-			pdf_path = attachments[0]
-			assert await anyio.Path(pdf_path).exists()
-
 			# Verify file size is non-trivial (has actual rendered content)
-			stat = await anyio.Path(pdf_path).stat()
-			assert stat.st_size > 1000, f'PDF seems too small ({stat.st_size} bytes), may be empty'
+			_assert_valid_pdf(attachments[0], min_size=1000)
 
 	async def test_save_as_pdf_header_footer_renders_url(self, tools, browser_session, http_server, base_url):
 		"""display_header_footer=True (the default) prints the page URL into the footer."""
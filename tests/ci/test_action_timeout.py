@@ -32,7 +32,6 @@ class _StubActionModel(ActionModel):
 	fast_action: dict[str, Any] | None = None
 
 
-@pytest.mark.asyncio
 async def test_act_enforces_per_action_timeout_on_hung_handler():
 	"""tools.act() must return within action_timeout even if the handler hangs."""
 	tools = Tools()
@@ -72,7 +71,6 @@ async def test_act_enforces_per_action_timeout_on_hung_handler():
 	assert 'hung_action' in result.error
 
 
-@pytest.mark.asyncio
 async def test_act_passes_through_fast_handler():
 	"""When the handler finishes fast, act() returns its result unchanged."""
 	tools = Tools()
@@ -90,7 +88,6 @@ async def test_act_passes_through_fast_handler():
 	assert result.extracted_content == 'done'
 
 
-@pytest.mark.asyncio
 async def test_act_rejects_invalid_action_timeout_override():
 	"""An invalid action_timeout override (nan / inf / <=0) must fall back to
 	the default, not silently defeat the timeout (nan → immediate timeout,
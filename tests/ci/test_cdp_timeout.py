@@ -36,7 +36,6 @@ def _make_wrapped_client_without_websocket(timeout_s: float) -> TimeoutWrappedCD
 	return client
 
 
-@pytest.mark.asyncio
 async def test_send_raw_times_out_on_silent_server():
 	"""The production TimeoutWrappedCDPClient.send_raw must cap a hung parent
 	send_raw within the configured timeout.
@@ -69,7 +68,6 @@ async def test_send_raw_times_out_on_silent_server():
 	assert 'within' in str(exc.value)
 
 
-@pytest.mark.asyncio
 async def test_send_raw_passes_through_when_fast():
 	"""A parent send_raw that returns quickly should bubble the result up unchanged."""
 	client = _make_wrapped_client_without_websocket(timeout_s=5.0)
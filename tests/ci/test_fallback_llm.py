@@ -347,7 +347,6 @@ class TestFallbackLLMIntegration:
 		llm.ainvoke.side_effect = mock_ainvoke
 		return llm
 
-	@pytest.mark.asyncio
 	async def test_get_model_output_switches_to_fallback_on_rate_limit(self, browser_session):
 		"""Test that get_model_output automatically switches to fallback on rate limit."""
 		from browser_use import Agent
@@ -381,7 +380,6 @@ class TestFallbackLLMIntegration:
 		assert agent.llm is fallback
 		assert agent._using_fallback_llm is True
 
-	@pytest.mark.asyncio
 	async def test_get_model_output_raises_when_no_fallback(self, browser_session):
 		"""Test that get_model_output raises error when no fallback is configured."""
 		from browser_use import Agent
@@ -409,7 +407,6 @@ class TestFallbackLLMIntegration:
 		with pytest.raises(ModelRateLimitError):
 			await agent.get_model_output(messages)
 
-	@pytest.mark.asyncio
 	async def test_get_model_output_raises_when_fallback_also_fails(self, browser_session):
 		"""Test that error is raised when fallback also fails."""
 		from browser_use import Agent
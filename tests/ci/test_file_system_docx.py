@@ -13,7 +13,6 @@ from browser_use.filesystem.file_system import (
 class TestDocxFile:
 	"""Test DOCX file operations."""
 
-	@pytest.mark.asyncio
 	async def test_create_docx_file(self, tmp_path: Path):
 		"""Test creating a DOCX file."""
 		fs = FileSystem(tmp_path)
@@ -28,7 +27,6 @@ Another paragraph."""
 		assert 'successfully' in result.lower()
 		assert 'test.docx' in fs.list_files()
 
-	@pytest.mark.asyncio
 	async def test_read_docx_file_internal(self, tmp_path: Path):
 		"""Test reading internal DOCX file."""
 		fs = FileSystem(tmp_path)
@@ -41,7 +39,6 @@ Some content here."""
 		assert 'test.docx' in result
 		assert 'Title' in result or 'content' in result
 
-	@pytest.mark.asyncio
 	async def test_read_docx_file_external(self, tmp_path: Path):
 		"""Test reading external DOCX file."""
 		from docx import Document
@@ -66,7 +63,6 @@ Some content here."""
 		assert docx_file.extension == 'docx'
 		assert docx_file.full_name == 'test.docx'
 
-	@pytest.mark.asyncio
 	async def test_docx_with_unicode_characters(self, tmp_path: Path):
 		"""Test DOCX with unicode and emoji content."""
 		fs = FileSystem(tmp_path)
@@ -82,14 +78,12 @@ Emoji: 😀 👍 🎉"""
 		assert 'Unicode Test' in read_result
 		# Note: Emoji may not be preserved in all systems
 
-	@pytest.mark.asyncio
 	async def test_empty_docx_file(self, tmp_path: Path):
 		"""Test creating an empty DOCX file."""
 		fs = FileSystem(tmp_path)
 		result = await fs.write_file('empty.docx', '')
 		assert 'successfully' in result.lower()
 
-	@pytest.mark.asyncio
 	async def test_large_docx_file(self, tmp_path: Path):
 		"""Test creating a large DOCX file."""
 		fs = FileSystem(tmp_path)
@@ -105,7 +99,6 @@ Emoji: 😀 👍 🎉"""
 		assert 'Line 0:' in read_result
 		assert 'Line 999:' in read_result
 
-	@pytest.mark.asyncio
 	async def test_corrupted_docx_file(self, tmp_path: Path):
 		"""Test reading a corrupted DOCX file."""
 		# Create a corrupted DOCX file
@@ -118,7 +111,6 @@ Emoji: 😀 👍 🎉"""
 		assert 'message' in structured_result
 		assert 'error' in structured_result['message'].lower() or 'could not' in structured_result['message'].lower()
 
-	@pytest.mark.asyncio
 	async def test_docx_with_multiple_paragraphs(self, tmp_path: Path):
 		"""Test DOCX with various paragraph styles."""
 		fs = FileSystem(tmp_path)
@@ -144,7 +136,6 @@ Final paragraph here."""
 class TestFileSystemDocxIntegration:
 	"""Integration tests for DOCX file type."""
 
-	@pytest.mark.asyncio
 	async def test_multiple_file_types_with_docx(self, tmp_path: Path):
 		"""Test working with DOCX alongside other file types."""
 		fs = FileSystem(tmp_path)
@@ -161,7 +152,6 @@ class TestFileSystemDocxIntegration:
 		assert 'notes.txt' in files
 		assert 'todo.md' in files  # Default file
 
-	@pytest.mark.asyncio
 	async def test_file_system_state_with_docx(self, tmp_path: Path):
 		"""Test FileSystem state serialization with DOCX files."""
 		fs = FileSystem(tmp_path)
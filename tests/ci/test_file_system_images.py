@@ -21,7 +21,6 @@ class TestImageFiles:
 		buffer.seek(0)
 		return buffer.read()
 
-	@pytest.mark.asyncio
 	async def test_read_external_png_image(self, tmp_path: Path):
 		"""Test reading external PNG image file."""
 		# Create an external image file
@@ -45,7 +44,6 @@ class TestImageFiles:
 		decoded = base64.b64decode(img_data['data'])
 		assert decoded == img_bytes
 
-	@pytest.mark.asyncio
 	async def test_read_external_jpg_image(self, tmp_path: Path):
 		"""Test reading external JPG image file."""
 		# Create an external image file
@@ -65,7 +63,6 @@ class TestImageFiles:
 		decoded = base64.b64decode(img_data['data'])
 		assert len(decoded) > 0
 
-	@pytest.mark.asyncio
 	async def test_read_jpeg_extension(self, tmp_path: Path):
 		"""Test reading .jpeg extension (not just .jpg)."""
 		external_file = tmp_path / 'test.jpeg'
@@ -78,7 +75,6 @@ class TestImageFiles:
 		assert structured_result['images'] is not None
 		assert structured_result['images'][0]['name'] == 'test.jpeg'
 
-	@pytest.mark.asyncio
 	async def test_read_nonexistent_image(self, tmp_path: Path):
 		"""Test reading a nonexistent image file."""
 		fs = FileSystem(tmp_path / 'workspace')
@@ -88,7 +84,6 @@ class TestImageFiles:
 		assert 'not found' in structured_result['message'].lower()
 		assert structured_result['images'] is None
 
-	@pytest.mark.asyncio
 	async def test_corrupted_image_file(self, tmp_path: Path):
 		"""Test reading a corrupted image file."""
 		external_file = tmp_path / 'corrupted.png'
@@ -104,7 +99,6 @@ class TestImageFiles:
 		# Base64 encoding will succeed even for invalid image data
 		assert structured_result['images'] is not None
 
-	@pytest.mark.asyncio
 	async def test_large_image_file(self, tmp_path: Path):
 		"""Test reading a large image file."""
 		# Create a large image (2000x2000)
@@ -120,7 +114,6 @@ class TestImageFiles:
 		# Verify base64 data is present and substantial
 		assert len(structured_result['images'][0]['data']) > 10000
 
-	@pytest.mark.asyncio
 	async def test_multiple_images_in_sequence(self, tmp_path: Path):
 		"""Test reading multiple images in sequence."""
 		fs = FileSystem(tmp_path / 'workspace')
@@ -143,7 +136,6 @@ class TestImageFiles:
 			assert result['images'] is not None
 			assert result['images'][0]['name'] == f'image_{i}.png'
 
-	@pytest.mark.asyncio
 	async def test_different_image_formats(self, tmp_path: Path):
 		"""Test reading different image format variations."""
 		fs = FileSystem(tmp_path / 'workspace')
@@ -167,7 +159,6 @@ class TestImageFiles:
 		result_png = await fs.read_file_structured(str(png_file), external_file=True)
 		assert result_png['images'] is not None
 
-	@pytest.mark.asyncio
 	async def test_image_with_transparency(self, tmp_path: Path):
 		"""Test reading PNG with transparency (RGBA)."""
 		external_file = tmp_path / 'transparent.png'
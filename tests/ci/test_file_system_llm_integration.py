@@ -27,7 +27,6 @@ class TestImageInLLMMessages:
 		buffer.seek(0)
 		return buffer.read()
 
-	@pytest.mark.asyncio
 	async def test_image_stored_in_message_manager(self, tmp_path: Path):
 		"""Test that images are stored in MessageManager state."""
 		fs = FileSystem(tmp_path)
@@ -55,7 +54,6 @@ class TestImageInLLMMessages:
 		assert mm.state.read_state_images[0]['name'] == 'test.png'
 		assert mm.state.read_state_images[0]['data'] == 'base64_test_data'
 
-	@pytest.mark.asyncio
 	async def test_images_cleared_after_step(self, tmp_path: Path):
 		"""Test that images are cleared after each step."""
 		fs = FileSystem(tmp_path)
@@ -77,7 +75,6 @@ class TestImageInLLMMessages:
 
 		assert len(mm.state.read_state_images) == 0
 
-	@pytest.mark.asyncio
 	async def test_multiple_images_accumulated(self, tmp_path: Path):
 		"""Test that multiple images in one step are accumulated."""
 		fs = FileSystem(tmp_path)
@@ -235,7 +232,6 @@ class TestImageInLLMMessages:
 class TestDocxInLLMMessages:
 	"""Test that DOCX content flows correctly through to LLM messages."""
 
-	@pytest.mark.asyncio
 	async def test_docx_in_extracted_content(self, tmp_path: Path):
 		"""Test that DOCX text appears in extracted_content."""
 		fs = FileSystem(tmp_path)
@@ -252,7 +248,6 @@ Some important content here."""
 		assert 'Title' in result
 		assert 'important content' in result
 
-	@pytest.mark.asyncio
 	async def test_docx_in_message_manager(self, tmp_path: Path):
 		"""Test that DOCX content appears in message manager state."""
 		fs = FileSystem(tmp_path)
@@ -293,7 +288,6 @@ class TestEndToEndIntegration:
 		buffer.seek(0)
 		return buffer.read()
 
-	@pytest.mark.asyncio
 	async def test_image_end_to_end(self, tmp_path: Path):
 		"""Test complete flow: external image → FileSystem → ActionResult → MessageManager → Prompt."""
 		# Step 1: Create external image
@@ -351,7 +345,6 @@ class TestEndToEndIntegration:
 		base64_str = base64.b64encode(img_bytes).decode('utf-8')
 		assert base64_str in image_parts[0].image_url.url
 
-	@pytest.mark.asyncio
 	async def test_docx_end_to_end(self, tmp_path: Path):
 		"""Test complete flow: DOCX file → FileSystem → ActionResult → MessageManager."""
 		# Step 1: Create DOCX
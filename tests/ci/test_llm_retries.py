@@ -17,7 +17,6 @@ class TestChatBrowserUseRetries:
 		"""Set up environment for ChatBrowserUse."""
 		monkeypatch.setenv('BROWSER_USE_API_KEY', 'test-api-key')
 
-	@pytest.mark.asyncio
 	async def test_retries_on_503_with_exponential_backoff(self, mock_env):
 		"""Test that 503 errors trigger retries with exponential backoff."""
 		from browser_use.llm.browser_use.chat import ChatBrowserUse
@@ -81,7 +80,6 @@ class TestChatBrowserUseRetries:
 		# Second delay should be roughly 2x the first (exponential)
 		assert delay_2 > delay_1, 'Second delay should be longer than first (exponential backoff)'
 
-	@pytest.mark.asyncio
 	async def test_no_retry_on_401(self, mock_env):
 		"""Test that 401 errors do NOT trigger retries."""
 		from browser_use.llm.browser_use.chat import ChatBrowserUse
@@ -113,7 +111,6 @@ class TestChatBrowserUseRetries:
 		# Should only attempt once (no retries for 401)
 		assert attempt_count == 1
 
-	@pytest.mark.asyncio
 	async def test_retries_on_timeout(self, mock_env):
 		"""Test that timeouts trigger retries."""
 		from browser_use.llm.browser_use.chat import ChatBrowserUse
@@ -145,7 +142,6 @@ class TestChatBrowserUseRetries:
 		assert attempt_count == 2
 		assert result.completion == 'Success after timeout!'
 
-	@pytest.mark.asyncio
 	async def test_max_retries_exhausted(self, mock_env):
 		"""Test that error is raised after max retries exhausted."""
 		from browser_use.llm.browser_use.chat import ChatBrowserUse
@@ -186,7 +182,6 @@ class TestChatGoogleRetries:
 		"""Set up environment for ChatGoogle."""
 		monkeypatch.setenv('GOOGLE_API_KEY', 'test-api-key')
 
-	@pytest.mark.asyncio
 	async def test_retries_on_503_with_exponential_backoff(self, mock_env):
 		"""Test that 503 errors trigger retries with exponential backoff."""
 		from browser_use.llm.exceptions import ModelProviderError
@@ -235,7 +230,6 @@ class TestChatGoogleRetries:
 		assert 0.1 <= delay_2 <= 0.5, f'Second delay {delay_2:.3f}s not in expected range'
 		assert delay_2 > delay_1, 'Second delay should be longer than first'
 
-	@pytest.mark.asyncio
 	async def test_no_retry_on_400(self, mock_env):
 		"""Test that 400 errors do NOT trigger retries."""
 		from browser_use.llm.exceptions import ModelProviderError
@@ -263,7 +257,6 @@ class TestChatGoogleRetries:
 		# Should only attempt once (400 is not retryable)
 		assert attempt_count == 1
 
-	@pytest.mark.asyncio
 	async def test_retries_on_429_rate_limit(self, mock_env):
 		"""Test that 429 rate limit errors trigger retries."""
 		from browser_use.llm.exceptions import ModelProviderError
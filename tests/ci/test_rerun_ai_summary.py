@@ -1,174 +1,160 @@
 """Tests for AI summary generation during rerun"""
 
-from unittest.mock import AsyncMock
+import base64
+from unittest.mock import AsyncMock, patch
+
+import pytest
 
 from browser_use.agent.service import Agent
 from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList, RerunSummaryAction, StepMetadata
+from browser_use.browser import BrowserSession
+from browser_use.browser.events import NavigateToUrlEvent
 from browser_use.browser.views import BrowserStateHistory
-from browser_use.dom.views import DOMRect, NodeType
-from tests.ci.conftest import create_mock_llm
-
-
-async def test_generate_rerun_summary_success():
-	"""Test that _generate_rerun_summary generates an AI summary for successful rerun"""
-	# Create mock LLM that returns RerunSummaryAction
-	summary_action = RerunSummaryAction(
-		summary='Form filled successfully',
-		success=True,
-		completion_status='complete',
+from browser_use.dom.views import DOMInteractedElement, DOMRect, NodeType
+from tests.ci.conftest import FakeSummaryLLM, create_mock_llm
+
+
+# Historical element whose identifiers match nothing on the test pages, so element matching always fails.
+# Built once at import; the rerun code only reads it.
+MISSING_BUTTON_ELEMENT = DOMInteractedElement(
+	node_id=1,
+	backend_node_id=9999,
+	frame_id=None,
+	node_type=NodeType.ELEMENT_NODE,
+	node_value='',
+	node_name='BUTTON',
+	attributes={'aria-label': 'non-existent-button', 'id': 'fake-id'},
+	x_path='html/body/button[999]',
+	element_hash=123456789,
+	stable_hash=987654321,
+	bounds=DOMRect(x=0, y=0, width=100, height=50),
+	ax_name='non-existent',
+)
+
+
+# Page with a button whose identifiers differ from MISSING_BUTTON_ELEMENT, served as a data: URL (no HTTP server needed)
+MISSING_BUTTON_PAGE_URL = 'data:text/html;base64,' + base64.b64encode(
+	b'<!DOCTYPE html><html><body><button id="real-button" aria-label="real-button">Click me</button></body></html>'
+).decode()
+
+
+def _navigate_then_click_missing_button_history(AgentOutput) -> AgentHistoryList:
+	"""Two-step history: navigate to MISSING_BUTTON_PAGE_URL (succeeds), then click MISSING_BUTTON_ELEMENT (fails)"""
+	test_url = MISSING_BUTTON_PAGE_URL
+	navigate_step = AgentHistory(
+		model_output=AgentOutput(
+			evaluation_previous_goal=None,
+			memory='Navigate to test page',
+			next_goal=None,
+			action=[{'navigate': {'url': test_url}}],  # type: ignore[arg-type]
+		),
+		result=[ActionResult(long_term_memory='Navigated')],
+		state=BrowserStateHistory(url=test_url, title='Test Page', tabs=[], interacted_element=[None]),
+		metadata=StepMetadata(step_start_time=0, step_end_time=1, step_number=1, step_interval=0.1),
 	)
-
-	async def custom_ainvoke(*args, **kwargs):
-		# Get output_format from second positional arg or kwargs
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		assert output_format is RerunSummaryAction
-		from browser_use.llm.views import ChatInvokeCompletion
-
-		return ChatInvokeCompletion(completion=summary_action, usage=None)
-
-	# Mock ChatOpenAI class
-	mock_openai = AsyncMock()
-	mock_openai.ainvoke.side_effect = custom_ainvoke
-
-	llm = create_mock_llm(actions=None)
-	agent = Agent(task='Test task', llm=llm)
-	await agent.browser_session.start()
-
-	try:
-		# Create some successful results
-		results = [
-			ActionResult(long_term_memory='Step 1 completed'),
-			ActionResult(long_term_memory='Step 2 completed'),
-		]
-
-		# Pass the mock LLM directly as summary_llm
-		summary = await agent._generate_rerun_summary('Test task', results, summary_llm=mock_openai)
-
-		# Check that result is the AI summary
-		assert summary.is_done is True
-		assert summary.success is True
-		assert summary.extracted_content == 'Form filled successfully'
-		assert 'Rerun completed' in (summary.long_term_memory or '')
-
-	finally:
-		await agent.close()
-
-
-async def test_generate_rerun_summary_with_errors():
-	"""Test that AI summary correctly reflects errors in execution"""
-	# Create mock LLM for summary
-	summary_action = RerunSummaryAction(
-		summary='Rerun had errors',
-		success=False,
-		completion_status='failed',
+	failing_step = AgentHistory(
+		model_output=AgentOutput(
+			evaluation_previous_goal=None,
+			memory='Trying to click non-existent button',
+			next_goal=None,
+			action=[{'click': {'index': 100}}],  # type: ignore[arg-type]
+		),
+		result=[ActionResult(long_term_memory='Clicked button')],  # Original succeeded
+		state=BrowserStateHistory(url=test_url, title='Test Page', tabs=[], interacted_element=[MISSING_BUTTON_ELEMENT]),
+		metadata=StepMetadata(step_start_time=0, step_end_time=1, step_number=2, step_interval=0.1),
 	)
+	return AgentHistoryList(history=[navigate_step, failing_step])
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		assert output_format is RerunSummaryAction
-		from browser_use.llm.views import ChatInvokeCompletion
 
-		return ChatInvokeCompletion(completion=summary_action, usage=None)
+@pytest.fixture(scope='module')
+async def summary_agent(browser_session):
+	"""Agent on the shared keep_alive browser_session for the _generate_rerun_summary tests (they don't mutate agent state)."""
+	agent = Agent(task='Test task', llm=create_mock_llm(actions=None), browser_session=browser_session)
+	yield agent
+	await agent.close()
 
-	mock_openai = AsyncMock()
-	mock_openai.ainvoke.side_effect = custom_ainvoke
-
-	llm = create_mock_llm(actions=None)
-	agent = Agent(task='Test task', llm=llm)
-	await agent.browser_session.start()
 
-	try:
-		# Create results with errors
-		results_with_errors = [
-			ActionResult(error='Failed to find element'),
-			ActionResult(error='Timeout'),
-		]
+@pytest.mark.parametrize(
+	'summary_action, results, expected_success',
+	[
+		(
+			RerunSummaryAction(summary='Form filled successfully', success=True, completion_status='complete'),
+			[
+				ActionResult(long_term_memory='Step 1 completed'),
+				ActionResult(long_term_memory='Step 2 completed'),
+			],
+			True,
+		),
+		(
+			RerunSummaryAction(summary='Rerun had errors', success=False, completion_status='failed'),
+			[
+				ActionResult(error='Failed to find element'),
+				ActionResult(error='Timeout'),
+			],
+			False,
+		),
+		(
+			RerunSummaryAction(summary='3 of 5 steps succeeded', success=False, completion_status='partial'),
+			[
+				ActionResult(long_term_memory='Step 1 completed'),
+				ActionResult(error='Step 2 failed'),
+				ActionResult(long_term_memory='Step 3 completed'),
+				ActionResult(error='Step 4 failed'),
+				ActionResult(long_term_memory='Step 5 completed'),
+			],
+			False,
+		),
+	],
+	ids=['success', 'with_errors', 'statistics'],
+)
+async def test_generate_rerun_summary(summary_agent, summary_action, results, expected_success):
+	"""Test that _generate_rerun_summary returns the AI summary, reflecting successes, errors and partial runs"""
 
-		# Pass the mock LLM directly as summary_llm
-		summary = await agent._generate_rerun_summary('Test task', results_with_errors, summary_llm=mock_openai)
+	mock_openai = FakeSummaryLLM(summary_action)
 
-		# Verify summary reflects errors
-		assert summary.is_done is True
-		assert summary.success is False
-		assert summary.extracted_content == 'Rerun had errors'
+	# Pass the mock LLM directly as summary_llm
+	summary = await summary_agent._generate_rerun_summary('Test task', results, summary_llm=mock_openai)
 
-	finally:
-		await agent.close()
+	# Check that result is the AI summary
+	assert summary.is_done is True
+	assert summary.success is expected_success
+	assert summary.extracted_content == summary_action.summary
+	assert 'Rerun completed' in (summary.long_term_memory or '')
+	assert mock_openai.calls == 1
 
 
-async def test_generate_rerun_summary_fallback_on_error():
+async def test_generate_rerun_summary_fallback_on_error(summary_agent):
 	"""Test that a fallback summary is generated if LLM fails"""
 	# Mock ChatOpenAI to throw an error
 	mock_openai = AsyncMock()
 	mock_openai.ainvoke.side_effect = Exception('LLM service unavailable')
 
-	llm = create_mock_llm(actions=None)
-	agent = Agent(task='Test task', llm=llm)
-	await agent.browser_session.start()
-
-	try:
-		# Create some results
-		results = [
-			ActionResult(long_term_memory='Step 1 completed'),
-			ActionResult(long_term_memory='Step 2 completed'),
-		]
-
-		# Pass the mock LLM directly as summary_llm
-		summary = await agent._generate_rerun_summary('Test task', results, summary_llm=mock_openai)
-
-		# Verify fallback summary
-		assert summary.is_done is True
-		assert summary.success is True  # No errors, so success=True
-		assert 'Rerun completed' in (summary.extracted_content or '')
-		assert '2/2' in (summary.extracted_content or '')  # Should show stats
-
-	finally:
-		await agent.close()
-
+	# Create some results
+	results = [
+		ActionResult(long_term_memory='Step 1 completed'),
+		ActionResult(long_term_memory='Step 2 completed'),
+	]
 
-async def test_generate_rerun_summary_statistics():
-	"""Test that summary includes execution statistics in the prompt"""
-	# Create mock LLM
-	summary_action = RerunSummaryAction(
-		summary='3 of 5 steps succeeded',
-		success=False,
-		completion_status='partial',
-	)
+	# Pass the mock LLM directly as summary_llm
+	summary = await summary_agent._generate_rerun_summary('Test task', results, summary_llm=mock_openai)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		assert output_format is RerunSummaryAction
-		from browser_use.llm.views import ChatInvokeCompletion
+	# Verify fallback summary
+	assert summary.is_done is True
+	assert summary.success is True  # No errors, so success=True
+	assert 'Rerun completed' in (summary.extracted_content or '')
+	assert '2/2' in (summary.extracted_content or '')  # Should show stats
 
-		return ChatInvokeCompletion(completion=summary_action, usage=None)
 
-	mock_openai = AsyncMock()
-	mock_openai.ainvoke.side_effect = custom_ainvoke
+async def test_generate_rerun_summary_empty_results_skips_llm(summary_agent):
+	"""Test that _generate_rerun_summary returns a summary without calling the LLM when nothing was replayed"""
+	mock_summary_llm = FakeSummaryLLM(RerunSummaryAction(summary='unused', success=False, completion_status='failed'))
 
-	llm = create_mock_llm(actions=None)
-	agent = Agent(task='Test task', llm=llm)
-	await agent.browser_session.start()
+	summary = await summary_agent._generate_rerun_summary('Test task', [], summary_llm=mock_summary_llm)
 
-	try:
-		# Create results with mix of success and errors
-		results = [
-			ActionResult(long_term_memory='Step 1 completed'),
-			ActionResult(error='Step 2 failed'),
-			ActionResult(long_term_memory='Step 3 completed'),
-			ActionResult(error='Step 4 failed'),
-			ActionResult(long_term_memory='Step 5 completed'),
-		]
-
-		# Pass the mock LLM directly as summary_llm
-		summary = await agent._generate_rerun_summary('Test task', results, summary_llm=mock_openai)
-
-		# Verify summary
-		assert summary.is_done is True
-		assert summary.success is False  # partial completion
-		assert '3 of 5' in (summary.extracted_content or '')
-
-	finally:
-		await agent.close()
+	assert mock_summary_llm.calls == 0
+	assert summary.is_done is True
+	assert summary.success is True
+	assert 'Rerun completed' in (summary.long_term_memory or '')
 
 
 async def test_rerun_skips_steps_with_original_errors():
@@ -181,16 +167,7 @@ async def test_rerun_skips_steps_with_original_errors():
 		completion_status='complete',
 	)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		if output_format is RerunSummaryAction:
-			from browser_use.llm.views import ChatInvokeCompletion
-
-			return ChatInvokeCompletion(completion=summary_action, usage=None)
-		raise ValueError('Unexpected output_format')
-
-	mock_summary_llm = AsyncMock()
-	mock_summary_llm.ainvoke.side_effect = custom_ainvoke
+	mock_summary_llm = FakeSummaryLLM(summary_action)
 
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
@@ -263,16 +240,7 @@ async def test_rerun_does_not_skip_originally_failed_when_skip_failures_false():
 		completion_status='complete',
 	)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		if output_format is RerunSummaryAction:
-			from browser_use.llm.views import ChatInvokeCompletion
-
-			return ChatInvokeCompletion(completion=summary_action, usage=None)
-		raise ValueError('Unexpected output_format')
-
-	mock_summary_llm = AsyncMock()
-	mock_summary_llm.ainvoke.side_effect = custom_ainvoke
+	mock_summary_llm = FakeSummaryLLM(summary_action)
 
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
@@ -332,90 +300,16 @@ async def test_rerun_does_not_skip_originally_failed_when_skip_failures_false():
 		await agent.close()
 
 
-async def test_rerun_cleanup_on_failure(httpserver):
+async def test_rerun_cleanup_on_failure():
 	"""Test that rerun_history properly cleans up resources (closes browser/connections) even when it fails.
 
 	This test verifies the try/finally cleanup logic by creating a step that will fail
 	(element matching fails) and checking that the browser session is properly closed afterward.
 	"""
-	from browser_use.dom.views import DOMInteractedElement
-
-	# Set up a test page with a button that has DIFFERENT attributes than our historical element
-	test_html = """<!DOCTYPE html>
-	<html>
-	<body>
-		<button id="real-button" aria-label="real-button">Click me</button>
-	</body>
-	</html>"""
-	httpserver.expect_request('/test').respond_with_data(test_html, content_type='text/html')
-	test_url = httpserver.url_for('/test')
-
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
-	AgentOutput = agent.AgentOutput
 
-	# Step 1: Navigate to test page
-	navigate_step = AgentHistory(
-		model_output=AgentOutput(
-			evaluation_previous_goal=None,
-			memory='Navigate to test page',
-			next_goal=None,
-			action=[{'navigate': {'url': test_url}}],  # type: ignore[arg-type]
-		),
-		result=[ActionResult(long_term_memory='Navigated')],
-		state=BrowserStateHistory(
-			url=test_url,
-			title='Test Page',
-			tabs=[],
-			interacted_element=[None],
-		),
-		metadata=StepMetadata(
-			step_start_time=0,
-			step_end_time=1,
-			step_number=1,
-			step_interval=0.1,
-		),
-	)
-
-	# Step 2: Click on element that won't be found (different identifiers)
-	failing_step = AgentHistory(
-		model_output=AgentOutput(
-			evaluation_previous_goal=None,
-			memory='Trying to click non-existent button',
-			next_goal=None,
-			action=[{'click': {'index': 100}}],  # type: ignore[arg-type]
-		),
-		result=[ActionResult(long_term_memory='Clicked button')],  # Original succeeded
-		state=BrowserStateHistory(
-			url=test_url,
-			title='Test Page',
-			tabs=[],
-			interacted_element=[
-				DOMInteractedElement(
-					node_id=1,
-					backend_node_id=9999,
-					frame_id=None,
-					node_type=NodeType.ELEMENT_NODE,
-					node_value='',
-					node_name='BUTTON',
-					attributes={'aria-label': 'non-existent-button', 'id': 'fake-id'},
-					x_path='html/body/button[999]',
-					element_hash=123456789,
-					stable_hash=987654321,
-					bounds=DOMRect(x=0, y=0, width=100, height=50),
-					ax_name='non-existent',
-				)
-			],
-		),
-		metadata=StepMetadata(
-			step_start_time=0,
-			step_end_time=1,
-			step_number=2,
-			step_interval=0.1,
-		),
-	)
-
-	history = AgentHistoryList(history=[navigate_step, failing_step])
+	history = _navigate_then_click_missing_button_history(agent.AgentOutput)
 
 	# Run rerun with skip_failures=False - should fail and raise RuntimeError
 	# but the try/finally should ensure cleanup happens
@@ -430,33 +324,25 @@ async def test_rerun_cleanup_on_failure(httpserver):
 		# Expected - the step should fail on element matching
 		assert 'failed after 1 attempts' in str(e)
 
-	# If we get here without hanging, the cleanup worked
-	# The browser session should be closed by the finally block in rerun_history
-	# We can verify by checking that calling close again doesn't cause issues
-	# (close() is idempotent - calling it multiple times should be safe)
-	await agent.close()  # Should not hang or error since already closed
+	# The finally block in rerun_history should have killed the browser and reset the session
+	assert agent.browser_session is not None
+	assert agent.browser_session._cdp_client_root is None
+	assert agent.browser_session.session_manager is None
 
+	# Calling close() again is a no-op: it must not hang, error, or kill the browser a second time
+	kill_spy = AsyncMock()
+	with patch.object(BrowserSession, 'kill', kill_spy):
+		await agent.close()
+	kill_spy.assert_not_called()
 
-async def test_rerun_records_errors_when_skip_failures_true(httpserver):
+
+async def test_rerun_records_errors_when_skip_failures_true(browser_session):
 	"""Test that rerun_history records errors in results even when skip_failures=True.
 
 	This ensures the AI summary correctly counts failures. Previously, when skip_failures=True
 	and a step failed after all retries, no error result was appended, causing the AI summary
 	to incorrectly report success=True even with multiple failures.
 	"""
-	from browser_use.dom.views import DOMInteractedElement
-
-	# Set up a test page with a button that has DIFFERENT attributes than our historical element
-	# This ensures element matching will fail (the historical element won't be found)
-	test_html = """<!DOCTYPE html>
-	<html>
-	<body>
-		<button id="real-button" aria-label="real-button">Click me</button>
-	</body>
-	</html>"""
-	httpserver.expect_request('/test').respond_with_data(test_html, content_type='text/html')
-	test_url = httpserver.url_for('/test')
-
 	# Create a mock LLM for summary that returns partial success
 	summary_action = RerunSummaryAction(
 		summary='Some steps failed',
@@ -464,88 +350,15 @@ async def test_rerun_records_errors_when_skip_failures_true(httpserver):
 		completion_status='partial',
 	)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		if output_format is RerunSummaryAction:
-			from browser_use.llm.views import ChatInvokeCompletion
-
-			return ChatInvokeCompletion(completion=summary_action, usage=None)
-		raise ValueError('Unexpected output_format')
-
-	mock_summary_llm = AsyncMock()
-	mock_summary_llm.ainvoke.side_effect = custom_ainvoke
+	mock_summary_llm = FakeSummaryLLM(summary_action)
 
 	llm = create_mock_llm(actions=None)
-	agent = Agent(task='Test task', llm=llm)
+	agent = Agent(task='Test task', llm=llm, browser_session=browser_session)
 
 	# Create history with:
 	# 1. First step navigates to test page (will succeed)
 	# 2. Second step tries to click a non-existent element (will fail on element matching)
-	AgentOutput = agent.AgentOutput
-
-	# Step 1: Navigate to test page
-	navigate_step = AgentHistory(
-		model_output=AgentOutput(
-			evaluation_previous_goal=None,
-			memory='Navigate to test page',
-			next_goal=None,
-			action=[{'navigate': {'url': test_url}}],  # type: ignore[arg-type]
-		),
-		result=[ActionResult(long_term_memory='Navigated')],
-		state=BrowserStateHistory(
-			url=test_url,
-			title='Test Page',
-			tabs=[],
-			interacted_element=[None],
-		),
-		metadata=StepMetadata(
-			step_start_time=0,
-			step_end_time=1,
-			step_number=1,
-			step_interval=0.1,
-		),
-	)
-
-	# Step 2: Click on element that won't exist on current page (different hash/attributes)
-	failing_step = AgentHistory(
-		model_output=AgentOutput(
-			evaluation_previous_goal=None,
-			memory='Trying to click non-existent button',
-			next_goal=None,
-			action=[{'click': {'index': 100}}],  # type: ignore[arg-type]  # Original index doesn't matter, matching will fail
-		),
-		result=[ActionResult(long_term_memory='Clicked button')],  # Original succeeded
-		state=BrowserStateHistory(
-			url=test_url,
-			title='Test Page',
-			tabs=[],
-			interacted_element=[
-				DOMInteractedElement(
-					node_id=1,
-					backend_node_id=9999,
-					frame_id=None,
-					node_type=NodeType.ELEMENT_NODE,
-					node_value='',
-					node_name='BUTTON',
-					# This element has completely different identifiers than the real button
-					attributes={'aria-label': 'non-existent-button', 'id': 'fake-id'},
-					x_path='html/body/button[999]',  # XPath that doesn't exist
-					element_hash=123456789,  # Hash that won't match
-					stable_hash=987654321,  # Stable hash that won't match
-					bounds=DOMRect(x=0, y=0, width=100, height=50),
-					ax_name='non-existent',
-				)
-			],
-		),
-		metadata=StepMetadata(
-			step_start_time=0,
-			step_end_time=1,
-			step_number=2,
-			step_interval=0.1,
-		),
-	)
-
-	history = AgentHistoryList(history=[navigate_step, failing_step])
+	history = _navigate_then_click_missing_button_history(agent.AgentOutput)
 
 	try:
 		# Run rerun with skip_failures=True - should NOT raise but should record the error
@@ -575,6 +388,12 @@ async def test_rerun_records_errors_when_skip_failures_true(httpserver):
 	finally:
 		await agent.close()
 
+	# close() stopped the shared keep_alive session's event bus; the next dispatch must restart it
+	# so later tests on the same browser_session still work
+	navigate_event = browser_session.event_bus.dispatch(NavigateToUrlEvent(url='about:blank', new_tab=False))
+	await navigate_event
+	await navigate_event.event_result(raise_if_any=True, raise_if_none=False)
+
 
 async def test_rerun_skips_redundant_retry_steps(httpserver):
 	"""Test that rerun_history skips redundant retry steps.
@@ -584,8 +403,6 @@ async def test_rerun_skips_redundant_retry_steps(httpserver):
 	When consecutive steps target the same element with the same action, the second step
 	should be skipped as a redundant retry.
 	"""
-	from browser_use.dom.views import DOMInteractedElement
-
 	# Set up a test page with a button
 	test_html = """<!DOCTYPE html>
 	<html>
@@ -603,16 +420,7 @@ async def test_rerun_skips_redundant_retry_steps(httpserver):
 		completion_status='complete',
 	)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		if output_format is RerunSummaryAction:
-			from browser_use.llm.views import ChatInvokeCompletion
-
-			return ChatInvokeCompletion(completion=summary_action, usage=None)
-		raise ValueError('Unexpected output_format')
-
-	mock_summary_llm = AsyncMock()
-	mock_summary_llm.ainvoke.side_effect = custom_ainvoke
+	mock_summary_llm = FakeSummaryLLM(summary_action)
 
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
@@ -737,8 +545,6 @@ async def test_rerun_skips_redundant_retry_steps(httpserver):
 
 async def test_is_redundant_retry_step_detection():
 	"""Test the _is_redundant_retry_step method directly."""
-	from browser_use.dom.views import DOMInteractedElement
-
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
 	AgentOutput = agent.AgentOutput
@@ -1026,8 +832,6 @@ async def test_wait_for_minimum_elements(httpserver):
 		await agent.browser_session.start()
 
 		# Navigate to the test page first
-		from browser_use.browser.events import NavigateToUrlEvent
-
 		await agent.browser_session.event_bus.dispatch(NavigateToUrlEvent(url=test_url, new_tab=False))
 
 		# Wait a bit for navigation
@@ -1060,8 +864,6 @@ async def test_rerun_waits_for_elements_before_matching(httpserver):
 	This test verifies that for actions needing element matching (like click),
 	the rerun logic waits for the page to have enough elements before proceeding.
 	"""
-	from browser_use.dom.views import DOMInteractedElement
-
 	# Set up a test page with elements
 	test_html = """<!DOCTYPE html>
 	<html>
@@ -1079,16 +881,7 @@ async def test_rerun_waits_for_elements_before_matching(httpserver):
 		completion_status='complete',
 	)
 
-	async def custom_ainvoke(*args, **kwargs):
-		output_format = args[1] if len(args) > 1 else kwargs.get('output_format')
-		if output_format is RerunSummaryAction:
-			from browser_use.llm.views import ChatInvokeCompletion
-
-			return ChatInvokeCompletion(completion=summary_action, usage=None)
-		raise ValueError('Unexpected output_format')
-
-	mock_summary_llm = AsyncMock()
-	mock_summary_llm.ainvoke.side_effect = custom_ainvoke
+	mock_summary_llm = FakeSummaryLLM(summary_action)
 
 	llm = create_mock_llm(actions=None)
 	agent = Agent(task='Test task', llm=llm)
@@ -1182,8 +975,6 @@ async def test_rerun_uses_exponential_backoff_retry_delays(httpserver):
 	"""Test that rerun uses exponential backoff delays between retries (5s, 10s, 20s, capped at 30s)."""
 	import time
 
-	from browser_use.dom.views import DOMInteractedElement
-
 	# Set up a test page with a button that won't match
 	test_html = """<!DOCTYPE html>
 	<html>